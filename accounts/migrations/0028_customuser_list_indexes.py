@@ -0,0 +1,44 @@
+# Generated by Django 5.2.11 on 2026-10-15 09:12
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0027_default_home_weather_enabled"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name="customuser",
+            index=models.Index(
+                fields=["is_active", "role", "username"],
+                name="user_active_role_uname_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="customuser",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("username"),
+                    name="gin_trgm_ops",
+                ),
+                name="user_uname_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="customuser",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("email"),
+                    name="gin_trgm_ops",
+                ),
+                name="user_email_trgm",
+            ),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.11 on 2026-10-15 22:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0029_customuser_updated_at"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="customuser",
+            index=models.Index(
+                fields=["is_active", "username"], name="user_active_uname_idx"
+            ),
+        ),
+    ]
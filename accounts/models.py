@@ -1,5 +1,7 @@
 from django.contrib.auth.models import AbstractUser
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 
 from accounts.managers import CustomUserManager
 
@@ -52,3 +54,27 @@ class CustomUser(AbstractUser):
         ],
         default="complete",
     )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            # default users list: is_active filter ordered by username, no sort
+            models.Index(
+                fields=["is_active", "username"],
+                name="user_active_uname_idx",
+            ),
+            # users list filtered by role as well, ordered by username
+            models.Index(
+                fields=["is_active", "role", "username"],
+                name="user_active_role_uname_idx",
+            ),
+            # icontains compiles to UPPER(col) LIKE UPPER(%s) on postgres
+            GinIndex(
+                OpClass(Upper("username"), name="gin_trgm_ops"),
+                name="user_uname_trgm",
+            ),
+            GinIndex(
+                OpClass(Upper("email"), name="gin_trgm_ops"),
+                name="user_email_trgm",
+            ),
+        ]
@@ -12,6 +12,26 @@ from apps.folders.folders import (
 from apps.folders.models import Folder
 
 
+def _folder_task_owner_ids(folder, page):
+    """Return the owners of a tasks folder's tasks, or None for other pages.
+
+    Call before deleting the folder, which moves its tasks to the Inbox.
+    """
+    if page != "tasks":
+        return None
+    from apps.tasks.views import _task_owner_ids
+
+    return _task_owner_ids(folder.task_set.all())
+
+
+def _folder_tasks_changed(user, owner_ids):
+    """Invalidate cached task lists after a tasks folder is removed."""
+    if owner_ids is not None:
+        from apps.tasks.views import _tasks_changed
+
+        _tasks_changed(user, owner_ids)
+
+
 def _redirect_page(page):
     """Redirect to the correct URL for a page, handling namespaced URLs."""
     if page == "notes":
@@ -108,6 +128,7 @@ def delete(request, id, page):
     except ObjectDoesNotExist:
         raise Http404("Record not found.")
 
+    owner_ids = _folder_task_owner_ids(folder, page)
     if folder.user == user:
         attr = f"{page}_folder"
         selected_folder_id = getattr(user, attr)
@@ -124,6 +145,7 @@ def delete(request, id, page):
         if getattr(user, attr) == folder.id:
             setattr(user, attr, 0)
             user.save()
+    _folder_tasks_changed(user, owner_ids)
 
     return _redirect_page(page)
 
@@ -399,6 +421,7 @@ def delete_htmx(request, id, page):
     except ObjectDoesNotExist:
         raise Http404("Record not found.")
 
+    owner_ids = _folder_task_owner_ids(folder, page)
     if folder.user == user:
         attr = f"{page}_folder"
         selected_folder_id = getattr(user, attr)
@@ -414,6 +437,7 @@ def delete_htmx(request, id, page):
         if getattr(user, attr) == folder.id:
             setattr(user, attr, 0)
             user.save()
+    _folder_tasks_changed(user, owner_ids)
 
     if request.headers.get("HX-Target") != "folder-tree-container":
         return HttpResponse(status=204, headers={"HX-Trigger": "foldersChanged"})
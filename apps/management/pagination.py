@@ -1,4 +1,4 @@
-from typing import Any, List
+from typing import Any, List, Tuple
 
 from django.contrib.auth.decorators import login_required
 from django.core.paginator import EmptyPage, InvalidPage, Paginator
@@ -114,6 +114,102 @@ class CustomPaginator(Paginator):
             return self.page(1).object_list
 
 
+class LitePaginator:
+    """
+    Prev/next paginator that never issues a COUNT(*).
+
+    Fetches one row past the page to find out whether a next page exists,
+    so it cannot report the total number of pages.
+    """
+
+    def __init__(
+        self,
+        object_list: Any,
+        per_page: int,
+        request: HttpRequest,
+        session_key: str,
+    ) -> None:
+        # Ensure consistent ordering for pagination
+        if hasattr(object_list, "query") and not object_list.query.order_by:
+            object_list = object_list.order_by("-pk")
+
+        self.object_list_source = object_list
+        self.per_page: int = per_page
+        self.request: HttpRequest = request
+        self.session_key: str = session_key
+
+    def _extract_page(self) -> int:
+        """
+        Helper function to extract the page number from the session.
+        Defaults to page 1 if extraction fails.
+        """
+        try:
+            page = int(self.request.session.get(self.session_key, 1))
+        except (TypeError, ValueError):
+            page = 0
+
+        if page < 1:
+            self.request.session[self.session_key] = 1
+            return 1
+
+        return page
+
+    @cached_property
+    def _window(self) -> Tuple[int, List[Any]]:
+        """
+        Evaluates the current page plus one extra row in a single query.
+        Falls back to page 1 if the stored page is past the end.
+        """
+        page = self._extract_page()
+        offset = (page - 1) * self.per_page
+        rows = list(self.object_list_source[offset : offset + self.per_page + 1])
+
+        if not rows and page > 1:
+            self.request.session[self.session_key] = 1
+            page = 1
+            rows = list(self.object_list_source[: self.per_page + 1])
+
+        return page, rows
+
+    @property
+    def number(self) -> int:
+        """
+        Returns the current page number.
+        """
+        return self._window[0]
+
+    @property
+    def has_previous(self) -> bool:
+        """
+        Returns whether the current page has a previous page.
+        """
+        return self.number > 1
+
+    @property
+    def has_next(self) -> bool:
+        """
+        Returns whether the current page has a next page.
+        """
+        return len(self._window[1]) > self.per_page
+
+    @property
+    def previous_page_number(self) -> int:
+        """
+        Returns the previous page number.
+        """
+        return self.number - 1
+
+    @property
+    def next_page_number(self) -> int:
+        """
+        Returns the next page number.
+        """
+        return self.number + 1
+
+    def get_object_list(self) -> List[Any]:
+        return self._window[1][: self.per_page]
+
+
 @login_required
 def change_page(request, session_key: str, trigger_key: str, page: int) -> int:
     """
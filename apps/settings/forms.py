@@ -1,7 +1,24 @@
 from django import forms
+from django.contrib.auth import password_validation
+from django.core.cache import cache
 
 from accounts.models import CustomUser
 
+# old-password verifications allowed per user per window (seconds)
+PASSWORD_CHECK_LIMIT = 5
+PASSWORD_CHECK_WINDOW = 60
+
+
+def _count_failed_check(key):
+    """Count a failed old-password check, starting a new window if needed."""
+    if cache.add(key, 1, PASSWORD_CHECK_WINDOW):
+        return
+    try:
+        cache.incr(key)
+    except ValueError:
+        # the window expired between add() and incr()
+        cache.set(key, 1, PASSWORD_CHECK_WINDOW)
+
 
 class ProfileForm(forms.ModelForm):
     class Meta:
@@ -23,15 +40,30 @@ class ChangePasswordForm(forms.ModelForm):
         cleaned_data = super().clean()
 
         old_password = cleaned_data.get("old_password")
-        if not self.instance.check_password(old_password):
-            raise forms.ValidationError("Old password is incorrect")
-
         new_password = cleaned_data.get("new_password")
         confirm_password = cleaned_data.get("confirm_password")
 
+        # missing fields are already reported as field errors
+        if not (old_password and new_password and confirm_password):
+            return cleaned_data
+
+        # run the cheap checks before the deliberately slow password hash
         if new_password != confirm_password:
             raise forms.ValidationError("New passwords do not match")
 
+        password_validation.validate_password(new_password, self.instance)
+
+        # only failed checks count, so the limit bounds password guesses
+        key = f"password-check:{self.instance.pk}"
+        if cache.get(key, 0) >= PASSWORD_CHECK_LIMIT:
+            raise forms.ValidationError(
+                "Too many attempts. Please wait a minute and try again"
+            )
+
+        if not self.instance.check_password(old_password):
+            _count_failed_check(key)
+            raise forms.ValidationError("Old password is incorrect")
+
         return cleaned_data
 
     def save(self, commit=True):
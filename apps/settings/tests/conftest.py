@@ -17,3 +17,10 @@ def client(user):
     client = Client()
     client.login(username="Ollie", password="clawboy")
     return client
+
+
+@pytest.fixture
+def admin(user):
+    user.role = "ADMIN"
+    user.save()
+    return user
@@ -1,7 +1,15 @@
 import pytest
+from django.core.cache import cache
+from django.test import RequestFactory
 from django.urls import reverse
 from pytest_django.asserts import assertTemplateUsed
 
+from accounts.models import CustomUser
+from apps.management.pagination import LitePaginator
+from apps.settings import forms
+from apps.settings.forms import PASSWORD_CHECK_LIMIT, ChangePasswordForm
+from apps.settings.users.forms import UserForm
+
 pytestmark = pytest.mark.django_db
 
 
@@ -18,3 +26,196 @@ def test_named_route(client):
 def test_correct_template(client):
     response = client.get(reverse("settings"))
     assertTemplateUsed(response, "settings/content.html")
+
+
+def test_change_password_mismatch_skips_old_password_check(user, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("check_password should not run")
+
+    monkeypatch.setattr(user, "check_password", fail)
+    form = ChangePasswordForm(
+        {
+            "old_password": "clawboy",
+            "new_password": "tuna-and-naps-42",
+            "confirm_password": "tuna-and-naps-43",
+        },
+        instance=user,
+    )
+    assert not form.is_valid()
+    assert "New passwords do not match" in form.non_field_errors()
+
+
+def test_change_password_is_throttled(user):
+    cache.delete(f"password-check:{user.pk}")
+    data = {
+        "old_password": "wrong",
+        "new_password": "tuna-and-naps-42",
+        "confirm_password": "tuna-and-naps-42",
+    }
+    for _ in range(PASSWORD_CHECK_LIMIT):
+        form = ChangePasswordForm(data, instance=user)
+        assert "Old password is incorrect" in form.non_field_errors()
+
+    form = ChangePasswordForm(data, instance=user)
+    assert "Old password is incorrect" not in form.non_field_errors()
+    assert not form.is_valid()
+
+
+def test_change_password_throttle_window_expires(user, monkeypatch):
+    key = f"password-check:{user.pk}"
+    cache.set(key, 1)
+
+    def expired(*args, **kwargs):
+        cache.delete(key)
+        raise ValueError(key)
+
+    monkeypatch.setattr(forms.cache, "incr", expired)
+    data = {
+        "old_password": "wrong",
+        "new_password": "tuna-and-naps-42",
+        "confirm_password": "tuna-and-naps-42",
+    }
+    form = ChangePasswordForm(data, instance=user)
+    assert "Old password is incorrect" in form.non_field_errors()
+    assert cache.get(key) == 1
+
+
+def test_bulk_switch_status(client, admin):
+    other = CustomUser.objects.create_user("Mabel", "mabel@gmail.com", "whiskers")
+    other.is_active = False
+    other.save()
+
+    response = client.post(
+        reverse("settings-bulk-switch-status"), {"user_ids": [admin.pk, other.pk]}
+    )
+    assert response.status_code == 204
+
+    other.refresh_from_db()
+    assert other.is_active
+    # the caller's own account is never toggled
+    assert CustomUser.objects.get(pk=admin.pk).is_active
+
+
+def test_bulk_change_role(client, admin):
+    other = CustomUser.objects.create_user("Mabel", "mabel@gmail.com", "whiskers")
+    response = client.post(
+        reverse("settings-bulk-change-role", args=["ADMIN"]),
+        {"user_ids": [admin.pk, other.pk]},
+    )
+    assert response.status_code == 204
+    other.refresh_from_db()
+    assert other.role == "ADMIN"
+
+    client.post(
+        reverse("settings-bulk-change-role", args=["USER"]), {"user_ids": [admin.pk]}
+    )
+    assert CustomUser.objects.get(pk=admin.pk).role == "ADMIN"
+
+
+def test_bulk_change_role_invalid(client, admin):
+    other = CustomUser.objects.create_user("Mabel", "mabel@gmail.com", "whiskers")
+    response = client.post(
+        reverse("settings-bulk-change-role", args=["OWNER"]), {"user_ids": [other.pk]}
+    )
+    assert response.status_code == 400
+    response = client.post(reverse("settings-change-role", args=[other.pk, "OWNER"]))
+    assert response.status_code == 400
+    other.refresh_from_db()
+    assert other.role == "USER"
+
+
+def test_user_changes_require_admin(client, user):
+    other = CustomUser.objects.create_user("Mabel", "mabel@gmail.com", "whiskers")
+    ids = {"user_ids": [user.pk, other.pk]}
+    responses = [
+        client.post(reverse("settings-bulk-change-role", args=["ADMIN"]), ids),
+        client.post(reverse("settings-bulk-switch-status"), ids),
+        client.post(reverse("settings-change-role", args=[other.pk, "ADMIN"])),
+        client.post(reverse("settings-switch-status", args=[other.pk])),
+    ]
+    assert [r.status_code for r in responses] == [403] * 4
+    assert not CustomUser.objects.filter(role="ADMIN").exists()
+    assert CustomUser.objects.filter(is_active=True).count() == 2
+
+
+def test_user_form_only_saves_changed_fields(user):
+    form = UserForm(
+        {
+            "username": user.username,
+            "email": user.email,
+            "first_name": user.first_name,
+            "last_name": user.last_name,
+            "role": "ADMIN",
+            "is_active": "True",
+        },
+        instance=user,
+    )
+    assert form.is_valid()
+    assert form.changed_data == ["role"]
+    form.save()
+    user.refresh_from_db()
+    assert user.role == "ADMIN"
+
+
+def test_user_list_not_modified(client, admin):
+    response = client.get(reverse("settings-user-list"))
+    assert response.status_code == 200
+    etag = response["ETag"]
+
+    response = client.get(reverse("settings-user-list"), HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 304
+
+    other = CustomUser.objects.create_user("Mabel", "mabel@gmail.com", "whiskers")
+    client.post(reverse("settings-switch-status", args=[other.pk]))
+    response = client.get(reverse("settings-user-list"), HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+
+
+# ------------------------------------
+# users list pagination
+# ------------------------------------
+
+
+def _lite_page(page):
+    for name in ("Mabel", "Tuna", "Pepper", "Biscuit", "Mochi"):
+        CustomUser.objects.get_or_create(username=name)
+    request = RequestFactory().get("/")
+    request.session = {"users_page": page}
+    users = CustomUser.objects.order_by("username")
+    return LitePaginator(users, 2, request, "users_page"), request
+
+
+def test_lite_paginator_first_page(user):
+    pagination, _ = _lite_page(1)
+    names = [u.username for u in pagination.get_object_list()]
+    assert names == ["Biscuit", "Mabel"]
+    assert pagination.number == 1
+    assert not pagination.has_previous
+    assert pagination.has_next
+
+
+def test_lite_paginator_middle_page(user):
+    pagination, _ = _lite_page(2)
+    names = [u.username for u in pagination.get_object_list()]
+    assert names == ["Mochi", "Ollie"]
+    assert pagination.has_previous
+    assert pagination.has_next
+    assert pagination.previous_page_number == 1
+    assert pagination.next_page_number == 3
+
+
+def test_lite_paginator_last_full_page(user):
+    # six users fill the last page exactly, so the extra row isn't there
+    pagination, _ = _lite_page(3)
+    names = [u.username for u in pagination.get_object_list()]
+    assert names == ["Pepper", "Tuna"]
+    assert pagination.has_previous
+    assert not pagination.has_next
+
+
+def test_lite_paginator_past_end(user):
+    pagination, request = _lite_page(9)
+    names = [u.username for u in pagination.get_object_list()]
+    assert names == ["Biscuit", "Mabel"]
+    assert pagination.number == 1
+    assert request.session["users_page"] == 1
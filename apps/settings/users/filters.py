@@ -10,19 +10,19 @@ class UserFilter(django_filters.FilterSet):
         choices=CustomUser.ROLE_OPTIONS,
         empty_label="All",
     )
-    is_active = django_filters.ChoiceFilter(
-        choices=(("True", "Active"), ("False", "Inactive")),
-        empty_label="All",
-        method="filter_is_active",
+    is_active = django_filters.TypedChoiceFilter(
+        choices=(("", "All"), ("True", "Active"), ("False", "Inactive")),
+        coerce=lambda value: value == "True",
     )
 
     class Meta:
         model = CustomUser
         fields = ["username", "email", "role", "is_active"]
 
-    def filter_is_active(self, queryset, name, value):
-        if value == "True":
-            return queryset.filter(is_active=True)
-        elif value == "False":
-            return queryset.filter(is_active=False)
-        return queryset
+    def get_form_class(self):
+        # these filters never vary per request, so build the form class once;
+        # form instances still deepcopy base_fields, so sharing it is safe
+        cls = type(self)
+        if "_form_class" not in cls.__dict__:
+            cls._form_class = super().get_form_class()
+        return cls._form_class
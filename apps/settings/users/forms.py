@@ -1,11 +1,9 @@
 from django import forms
 
 from accounts.models import CustomUser
-from config.settings import CustomFormRenderer
 
 
 class UserForm(forms.ModelForm):
-    default_renderer = CustomFormRenderer
     is_active = forms.ChoiceField(
         choices=[("True", "Active"), ("False", "Inactive")],
         label="Status",
@@ -18,14 +16,25 @@ class UserForm(forms.ModelForm):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         if self.instance.pk:
-            self.fields["is_active"].initial = str(self.instance.is_active)
+            # compare as the posted string so changed_data only flags real edits
+            self.initial["is_active"] = str(self.instance.is_active)
 
     def clean_is_active(self):
         return self.cleaned_data["is_active"] == "True"
 
+    def save(self, commit=True):
+        user = super().save(commit=False)
+        if commit:
+            if user.pk:
+                if self.changed_data:
+                    user.save(update_fields=[*self.changed_data, "updated_at"])
+            else:
+                user.save()
+            self._save_m2m()
+        return user
+
 
 class CreateUserForm(forms.ModelForm):
-    default_renderer = CustomFormRenderer
     password = forms.CharField(widget=forms.PasswordInput)
 
     class Meta:
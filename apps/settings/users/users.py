@@ -1,19 +1,18 @@
+import hashlib
+import json
+
+from django.db.models import Count, Max
+
 from accounts.models import CustomUser
-from apps.management.pagination import CustomPaginator
+from apps.management.pagination import LitePaginator
 from apps.settings.users.filters import UserFilter
 
 DEFAULT_USER_FILTER = {"is_active": "True"}
 
+USER_FILTER_KEYS = ("username", "email", "role", "is_active", "sort")
 
-def get_user_list(request):
-    queryset = CustomUser.objects.all()
-
-    filter_data = request.session.get("users_filter", DEFAULT_USER_FILTER)
-    user_filter = UserFilter(filter_data, queryset=queryset)
-    users = user_filter.qs
-
-    current_order = filter_data.get("sort", "username")
-    valid_sorts = (
+VALID_USER_SORTS = frozenset(
+    (
         "username",
         "-username",
         "email",
@@ -23,14 +22,50 @@ def get_user_list(request):
         "is_active",
         "-is_active",
     )
-    if current_order in valid_sorts:
+)
+
+
+def filter_digest(filter_data):
+    """Return a short stable digest of a users filter dict."""
+    return hashlib.blake2b(
+        json.dumps(filter_data, sort_keys=True).encode(), digest_size=8
+    ).hexdigest()
+
+
+def user_list_etag(request):
+    """Fingerprint the users table for the current filter, sort and page.
+
+    Writes to CustomUser stamp updated_at, and deletes change the count.
+    """
+    stats = CustomUser.objects.aggregate(count=Count("pk"), modified=Max("updated_at"))
+    modified = stats["modified"].timestamp() if stats["modified"] else 0
+    filter_data = request.session.get("users_filter", DEFAULT_USER_FILTER)
+    page = request.session.get("users_page", 1)
+    return f"{stats['count']}-{modified}-{filter_digest(filter_data)}-{page}"
+
+
+def get_user_list(request):
+    # only the columns rendered by user-table.html (get_full_name needs the names)
+    queryset = CustomUser.objects.only(
+        "id", "username", "email", "first_name", "last_name", "role", "is_active"
+    )
+
+    filter_data = request.session.get("users_filter", DEFAULT_USER_FILTER)
+    user_filter = UserFilter(filter_data, queryset=queryset)
+    users = user_filter.qs
+
+    # the username default is still ordered explicitly; the (is_active,
+    # username) index serves it without a sort step, and the (is_active, role,
+    # username) index does the same when a role is selected
+    current_order = filter_data.get("sort", "username")
+    if current_order in VALID_USER_SORTS:
         users = users.order_by(current_order)
     else:
         users = users.order_by("username")
 
     session_key = "users_page"
     trigger_key = "userListReload"
-    pagination = CustomPaginator(users, 10, request, session_key)
+    pagination = LitePaginator(users, 10, request, session_key)
 
     return {
         "subapp": "users",
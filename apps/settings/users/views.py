@@ -1,21 +1,59 @@
+from functools import wraps
+
 from django.contrib.auth.decorators import login_required
-from django.http import HttpResponse
+from django.core.cache import cache
+from django.db.models import F
+from django.http import (
+    Http404,
+    HttpResponse,
+    HttpResponseBadRequest,
+    HttpResponseForbidden,
+)
 from django.shortcuts import get_object_or_404, render
+from django.template.loader import render_to_string
+from django.utils import timezone
+from django.views.decorators.http import condition, require_POST
 
 from accounts.models import CustomUser
 from apps.settings.users.filters import UserFilter
 from apps.settings.users.forms import CreateUserForm, UserForm
-from apps.settings.users.users import DEFAULT_USER_FILTER, get_user_list
+from apps.settings.users.users import (
+    DEFAULT_USER_FILTER,
+    USER_FILTER_KEYS,
+    filter_digest,
+    get_user_list,
+    user_list_etag,
+)
+
+VALID_ROLES = frozenset(role for role, _ in CustomUser.ROLE_OPTIONS)
+
+
+def admin_required(view):
+    """Return 403 unless the logged-in user is an admin."""
+
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        if request.user.role != "ADMIN":
+            return HttpResponseForbidden()
+        return view(request, *args, **kwargs)
+
+    return wrapper
 
 
 @login_required
 def users_index(request):
-    context = {"page": "settings"}
-    context.update(get_user_list(request))
+    # the table itself is loaded by the hx-trigger="load" on the wrapper
+    context = {
+        "page": "settings",
+        "subapp": "users",
+        "trigger_key": "userListReload",
+        "session_key": "users_page",
+    }
     return render(request, "settings/users/index.html", context)
 
 
 @login_required
+@condition(etag_func=user_list_etag)
 def user_list(request):
     context = {"page": "settings"}
     context.update(get_user_list(request))
@@ -26,19 +64,29 @@ def user_list(request):
 def user_filter(request):
     if request.method == "POST":
         filter_data = {
-            k: v for k, v in request.POST.items() if k != "csrfmiddlewaretoken"
+            k: request.POST[k] for k in USER_FILTER_KEYS if request.POST.get(k)
         }
-        request.session["users_filter"] = filter_data
+        if request.session.get("users_filter") != filter_data:
+            request.session["users_filter"] = filter_data
         return HttpResponse(status=204, headers={"HX-Trigger": "userListReload"})
 
+    # the modal depends only on the filter values, so cache it per value set;
+    # it carries no csrf token (htmx sends it as a header from base.html)
     filter_data = request.session.get("users_filter", DEFAULT_USER_FILTER)
-    user_filter = UserFilter(filter_data)
-    return render(request, "settings/users/filter.html", {"filter": user_filter})
+    key = f"userfilter:{filter_digest(filter_data)}"
+    html = cache.get(key)
+    if html is None:
+        user_filter = UserFilter(filter_data)
+        html = render_to_string("settings/users/filter.html", {"filter": user_filter})
+        cache.set(key, html, 300)
+    return HttpResponse(html)
 
 
 @login_required
 def user_sort(request, order):
-    filter_data = request.session.get("users_filter", DEFAULT_USER_FILTER)
+    session = request.session
+    # copy so the module-level default is never mutated
+    filter_data = dict(session.get("users_filter", DEFAULT_USER_FILTER))
     current_sort = filter_data.get("sort", "username")
 
     if current_sort == order:
@@ -49,27 +97,64 @@ def user_sort(request, order):
         new_sort = order
 
     filter_data["sort"] = new_sort
-    request.session["users_filter"] = filter_data
-    request.session["users_page"] = 1
-    request.session.modified = True
+    session.update({"users_filter": filter_data, "users_page": 1})
 
     return HttpResponse(status=204, headers={"HX-Trigger": "userListReload"})
 
 
 @login_required
+@admin_required
 def change_role(request, user_id, role):
-    user = get_object_or_404(CustomUser, pk=user_id)
-    if role in ("ADMIN", "USER"):
-        user.role = role
-        user.save(update_fields=["role"])
+    if role not in VALID_ROLES:
+        return HttpResponseBadRequest("Invalid role.")
+    # admins can't change their own role
+    if user_id == request.user.pk:
+        return HttpResponseForbidden()
+    updated = CustomUser.objects.filter(pk=user_id).update(
+        role=role, updated_at=timezone.now()
+    )
+    if not updated:
+        raise Http404("User not found.")
     return HttpResponse(status=204, headers={"HX-Trigger": "userListReload"})
 
 
 @login_required
+@admin_required
 def switch_status(request, user_id):
-    user = get_object_or_404(CustomUser, pk=user_id)
-    user.is_active = not user.is_active
-    user.save(update_fields=["is_active"])
+    # admins can't deactivate themselves
+    if user_id == request.user.pk:
+        return HttpResponseForbidden()
+    updated = CustomUser.objects.filter(pk=user_id).update(
+        is_active=~F("is_active"), updated_at=timezone.now()
+    )
+    if not updated:
+        raise Http404("User not found.")
+    return HttpResponse(status=204, headers={"HX-Trigger": "userListReload"})
+
+
+def _selected_users(request):
+    """Return the users ticked in the list, never including the caller."""
+    ids = [pk for pk in request.POST.getlist("user_ids") if pk.isdigit()]
+    return CustomUser.objects.filter(pk__in=ids).exclude(pk=request.user.pk)
+
+
+@login_required
+@require_POST
+@admin_required
+def bulk_change_role(request, role):
+    if role not in VALID_ROLES:
+        return HttpResponseBadRequest("Invalid role.")
+    _selected_users(request).update(role=role, updated_at=timezone.now())
+    return HttpResponse(status=204, headers={"HX-Trigger": "userListReload"})
+
+
+@login_required
+@require_POST
+@admin_required
+def bulk_switch_status(request):
+    _selected_users(request).update(
+        is_active=~F("is_active"), updated_at=timezone.now()
+    )
     return HttpResponse(status=204, headers={"HX-Trigger": "userListReload"})
 
 
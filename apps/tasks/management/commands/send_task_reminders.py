@@ -12,7 +12,7 @@ from django.core.management.base import BaseCommand
 from django.utils import timezone
 
 from apps.tasks.models import Task
-from config.email import send_past_due_digest_email, send_task_reminder_email
+from config.email import send_past_due_digest_email, send_task_reminders_batch
 
 
 class Command(BaseCommand):
@@ -55,30 +55,32 @@ class Command(BaseCommand):
                 error_count += 1
 
         # Category 2: Due today, no time set
-        for task in base_qs.filter(due_date=today, due_time__isnull=True):
-            sent_count, error_count = self._send(
-                task, "due_today", today, sent_count, error_count
-            )
+        reminders = [
+            (task.user, task, "due_today")
+            for task in base_qs.filter(due_date=today, due_time__isnull=True)
+        ]
 
         # Category 3: Due today with time, within ~1 hour
         for task in base_qs.filter(due_date=today, due_time__isnull=False):
             due_dt = timezone.make_aware(datetime.combine(today, task.due_time))
             minutes_until = (due_dt - now).total_seconds() / 60
             if 0 <= minutes_until <= 75:
-                sent_count, error_count = self._send(
-                    task, "due_soon", today, sent_count, error_count
-                )
+                reminders.append((task.user, task, "due_soon"))
+
+        def record(reminder, result):
+            nonlocal sent_count, error_count
+            if result["success"]:
+                task = reminder[1]
+                task.reminder_sent_date = today
+                task.save(update_fields=["reminder_sent_date"])
+                sent_count += 1
+            else:
+                error_count += 1
+
+        # one SMTP connection for the whole batch; each reminder is marked as
+        # soon as it is sent so an exception mid-batch can't cause a resend
+        send_task_reminders_batch(reminders, on_result=record)
 
         self.stdout.write(
             self.style.SUCCESS(f"Sent {sent_count} reminder(s), {error_count} error(s)")
         )
-
-    def _send(self, task, reminder_type, today, sent_count, error_count):
-        result = send_task_reminder_email(task.user, task, reminder_type)
-        if result["success"]:
-            task.reminder_sent_date = today
-            task.save(update_fields=["reminder_sent_date"])
-            sent_count += 1
-        else:
-            error_count += 1
-        return sent_count, error_count
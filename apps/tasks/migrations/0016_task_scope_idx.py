@@ -0,0 +1,20 @@
+# Generated by Django 5.2.11 on 2026-10-15 11:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0015_alter_task_priority"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                fields=["user", "folder", "is_recurring", "archived", "status"],
+                name="task_scope_idx",
+            ),
+        ),
+    ]
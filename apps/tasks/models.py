@@ -58,3 +58,9 @@ class Task(TimestampMixin, models.Model):
 
     class Meta:
         db_table = "app_task"
+        indexes = [
+            models.Index(
+                fields=["user", "folder", "is_recurring", "archived", "status"],
+                name="task_scope_idx",
+            ),
+        ]
@@ -1,4 +1,5 @@
 import pytest
+from django.core.cache import cache
 from django.test import Client
 
 from accounts.models import CustomUser
@@ -6,6 +7,12 @@ from apps.folders.models import Folder
 from apps.tasks.models import Task
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    # task lists are cached per user id, and ids repeat across tests
+    cache.clear()
+
+
 @pytest.fixture
 def user():
     user = CustomUser.objects.create_user("Ollie", "ollie@gmail.com", "clawboy")
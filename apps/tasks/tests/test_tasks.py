@@ -1,8 +1,16 @@
+import smtplib
+from datetime import date
+
 import pytest
+from django.core.management import call_command
+from django.test import Client
 from django.urls import reverse
 from pytest_django.asserts import assertTemplateUsed
 
+from accounts.models import CustomUser
 from apps.tasks.models import Task
+from config import email
+from config.email import send_task_reminders_batch
 
 pytestmark = pytest.mark.django_db(transaction=True, reset_sequences=True)
 
@@ -50,6 +58,12 @@ def test_status(client, task):
     assert response.status_code == 302
     task = Task.objects.filter(pk=task.id).get()
     assert task.status == 1
+    assert task.completed_date is not None
+
+    client.get(f"/tasks/{task.id}/complete")
+    task = Task.objects.filter(pk=task.id).get()
+    assert task.status == 0
+    assert task.completed_date is None
 
 
 def test_add_data(user, client, folder):
@@ -86,6 +100,22 @@ def test_edit_data(user, client, folder, task):
     assert found
 
 
+def test_edit_other_users_task(client, task):
+    other = CustomUser.objects.create_user("Mabel", "mabel@gmail.com", "clawgirl")
+    Task.objects.filter(pk=task.id).update(user=other)
+    response = client.post(f"/tasks/{task.id}/edit", {"title": "Sweep garage"})
+    assert response.status_code == 404
+    assert not Task.objects.filter(title="Sweep garage").exists()
+
+
+def test_status_other_users_task(client, task):
+    other = CustomUser.objects.create_user("Mabel", "mabel@gmail.com", "clawgirl")
+    Task.objects.filter(pk=task.id).update(user=other, folder=None)
+    response = client.get(f"/tasks/{task.id}/status")
+    assert response.status_code == 404
+    assert Task.objects.get(pk=task.id).status == 0
+
+
 def test_clear(client, tasks, folder):
     # Select the folder so clear operates on it
     client.get(f"/folders/{folder.id}/tasks")
@@ -93,3 +123,142 @@ def test_clear(client, tasks, folder):
     client.get("/tasks/clear")
     assert not Task.objects.filter(folder=folder, archived=False).exists()
     assert Task.objects.filter(folder=folder, archived=True).exists()
+
+
+def test_list_reflects_new_task(client, tasks):
+    response = client.get(reverse("tasks-list"))
+    assert b"Walk the dog" not in response.content
+
+    response = client.post(reverse("tasks-add-htmx"), {"title": "walk the dog"})
+    assert b"Walk the dog" in response.content
+
+
+def test_reminders_batch(tasks, mailoutbox):
+    reminders = [(task.user, task, "due_today") for task in tasks[:2]]
+    results = send_task_reminders_batch(reminders)
+    assert results == [{"success": True}, {"success": True}]
+    assert len(mailoutbox) == 2
+    assert mailoutbox[0].subject == f"Task Due Today: {tasks[0].title}"
+
+
+def test_reminders_batch_bad_header(tasks, mailoutbox):
+    Task.objects.filter(pk=tasks[0].id).update(title="Walk\nthe dog")
+    tasks[0].refresh_from_db()
+    reminders = [(task.user, task, "due_today") for task in tasks[:2]]
+    results = send_task_reminders_batch(reminders)
+    assert not results[0]["success"]
+    assert results[1] == {"success": True}
+    assert len(mailoutbox) == 1
+
+
+class FakeConnection:
+    """Mail connection that drops or refuses the first few sends."""
+
+    def __init__(self, drops=0, refusals=0):
+        self.drops = drops
+        self.refusals = refusals
+        self.opened = 0
+        self.attempts = 0
+        self.sent = []
+
+    def open(self):
+        self.opened += 1
+
+    def close(self):
+        pass
+
+    def send_messages(self, messages):
+        self.attempts += 1
+        if self.drops:
+            self.drops -= 1
+            raise smtplib.SMTPServerDisconnected("dropped")
+        if self.refusals:
+            self.refusals -= 1
+            raise smtplib.SMTPException("refused")
+        self.sent.extend(messages)
+        return len(messages)
+
+
+def test_reminders_batch_reconnects(tasks, monkeypatch):
+    connection = FakeConnection(drops=1)
+    monkeypatch.setattr(email, "get_connection", lambda **kwargs: connection)
+    reminders = [(task.user, task, "due_today") for task in tasks[:2]]
+    results = send_task_reminders_batch(reminders)
+    assert results == [{"success": True}, {"success": True}]
+    # the dropped send is retried once on a reopened connection
+    assert connection.opened == 2
+    assert connection.attempts == 3
+    assert len(connection.sent) == 2
+
+
+def test_reminders_batch_aborts(user, folder, monkeypatch):
+    size = email.BATCH_ABORT_MIN_SIZE
+    tasks = Task.objects.bulk_create(
+        Task(user=user, folder=folder, title=f"Task {i}") for i in range(size)
+    )
+    connection = FakeConnection(refusals=size)
+    monkeypatch.setattr(email, "get_connection", lambda **kwargs: connection)
+    results = send_task_reminders_batch([(user, task, "due_today") for task in tasks])
+
+    # stops once more than a third of the batch has failed
+    max_failures = size // 3
+    assert connection.attempts == max_failures + 1
+    assert len(results) == size
+    assert all(r["error"] == "refused" for r in results[: max_failures + 1])
+    aborted = results[max_failures + 1 :]
+    assert aborted == [{"success": False, "error": "Batch aborted"}] * len(aborted)
+
+
+def test_reminders_marked_as_sent(user, tasks, mailoutbox, monkeypatch):
+    CustomUser.objects.filter(pk=user.id).update(email_reminders=True)
+    Task.objects.filter(pk__in=[t.id for t in tasks[:2]]).update(due_date=date.today())
+    build = email._build_reminder_message
+    calls = []
+
+    def build_once(*args):
+        calls.append(args)
+        if len(calls) > 1:
+            raise RuntimeError("unexpected")
+        return build(*args)
+
+    monkeypatch.setattr(email, "_build_reminder_message", build_once)
+    with pytest.raises(RuntimeError):
+        call_command("send_task_reminders")
+    # the reminder delivered before the failure is not sent again
+    assert len(mailoutbox) == 1
+    assert Task.objects.filter(reminder_sent_date=date.today()).count() == 1
+
+
+def test_list_reflects_editor_change(client, settings, tasks, folder):
+    settings.CACHE_IS_SHARED = True
+    client.get(reverse("tasks-all"))
+    client.get(reverse("tasks-list"))
+
+    editor = CustomUser.objects.create_user("Mabel", "mabel@gmail.com", "clawgirl")
+    folder.editors.add(editor)
+    editor_client = Client()
+    editor_client.login(username="Mabel", password="clawgirl")
+    editor_client.get(f"/tasks/{tasks[0].id}/priority", {"priority": 9})
+
+    response = client.get(reverse("tasks-list"))
+    rows = {row["id"]: row for row in response.context["tasks"]}
+    assert rows[tasks[0].id]["priority"] == 9
+
+
+def test_list_reads_old_string_priority_filter(client, tasks):
+    client.get(reverse("tasks-all"))
+    Task.objects.filter(pk=tasks[0].id).update(priority=1)
+    # sessions written before the filter was normalized hold a string
+    session = client.session
+    session["tasks_filter"] = {"priority": "1"}
+    session.save()
+
+    response = client.get(reverse("tasks-list"))
+    assert response.context["priority_value"] == 1
+    assert [row["id"] for row in response.context["tasks"]] == [tasks[0].id]
+
+    session["tasks_filter"] = {"priority": "high"}
+    session.save()
+    response = client.get(reverse("tasks-list"))
+    assert response.context["priority_value"] is None
+    assert len(response.context["tasks"]) == len(tasks)
@@ -1,7 +1,13 @@
+import hashlib
+import json
+import time
 from datetime import date
 
+from django.conf import settings
 from django.contrib.auth.decorators import login_required
-from django.core.exceptions import ObjectDoesNotExist
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Case, DateField, F, Q, Value, When
 from django.http import Http404, HttpResponse
 from django.shortcuts import get_object_or_404, redirect, render
 
@@ -14,23 +20,169 @@ from apps.tasks.forms import TaskForm
 from apps.tasks.models import Task
 
 
-def _get_task_list_context(request):
-    """Helper to build context for task list partial."""
+# task list data is cached per user; any write bumps the version of every user
+# whose list shows the task. Writes made elsewhere (home page, cron) age out via
+# the timeout. A per-process cache can't see other workers' bumps, so the cache
+# is only used when it is shared (settings.CACHE_IS_SHARED).
+TASK_LIST_CACHE_TIMEOUT = 60
+
+_VALID_SORTS = frozenset(
+    (
+        "title",
+        "-title",
+        "due_date",
+        "-due_date",
+        "-created_at",
+        "priority",
+        "-priority",
+    )
+)
+_PRIORITY_CHOICES = tuple(range(1, 11))
+_PRIORITY_LIST = list(_PRIORITY_CHOICES)
+
+# recurrence type -> (recurrence_day, recurrence_month) for a due date;
+# a None month leaves the stored month alone
+_RECURRENCE_FIELDS = {
+    "daily": lambda d: (None, None),
+    "weekly": lambda d: (d.weekday(), None),
+    "monthly": lambda d: (d.day, None),
+    "yearly": lambda d: (d.day, d.month),
+}
+
+
+def _task_list_version_key(user_id):
+    return f"tasks:{user_id}:ver"
+
+
+def _task_owner_ids(tasks):
+    """Return the ids of the owners of these tasks and of their folders.
+
+    Call before the write, since it may move or delete the tasks.
+    """
+    if not settings.CACHE_IS_SHARED:
+        return set()
+    ids = set()
+    for row in tasks.values_list("user_id", "folder__user_id"):
+        ids.update(row)
+    ids.discard(None)
+    return ids
+
+
+def _tasks_changed(user, owner_ids=()):
+    """Invalidate the cached task lists for a user and any other task owners."""
+    if not settings.CACHE_IS_SHARED:
+        return
+    for user_id in {user.id, *owner_ids}:
+        key = _task_list_version_key(user_id)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, time.time_ns(), None)
+
+
+def _task_list_cache_key(request, selected_folder, tasks_folder_all, filter_data):
+    version = cache.get_or_set(
+        _task_list_version_key(request.user.id), time.time_ns, None
+    )
+    digest = hashlib.blake2b(
+        json.dumps(filter_data, sort_keys=True).encode(), digest_size=8
+    ).hexdigest()
+    folder_id = selected_folder.id if selected_folder else 0
+    page = request.session.get("tasks_page", 1)
+    return (
+        f"tasks:{request.user.id}:v{version}:{digest}:{folder_id}:{page}"
+        f":{int(tasks_folder_all)}"
+    )
+
+
+def _accessible_tasks(request):
+    """Return the tasks a user may change.
+
+    That is their own tasks plus any task in a folder they own or edit.
+    """
     user = request.user
-    folders = get_task_folders(request)
-    selected_folder = select_folder(request, "tasks")
-    tasks_folder_all = request.session.get("tasks_all", False)
+    folders = Folder.objects.filter(Q(user=user) | Q(editors=user))
+    return Task.objects.filter(Q(user=user) | Q(folder__in=folders))
+
+
+def _selected_folder(request):
+    """Return the selected task folder, looked up once per request.
+
+    The lookup is keyed on user.tasks_folder so views that change the
+    selection mid-request still see the new folder.
+    """
+    folder_id = request.user.tasks_folder
+    cached = getattr(request, "_selected_tasks_folder", None)
+    if cached is None or cached[0] != folder_id:
+        cached = (folder_id, select_folder(request, "tasks"))
+        request._selected_tasks_folder = cached
+    return cached[1]
+
 
-    if tasks_folder_all:
-        queryset = Task.objects.filter(user=user, is_recurring=False)
+def _scoped_task_qs(
+    request, selected_folder, *, include_recurring=False, include_archived=False
+):
+    """Return the tasks in the active view: All, the selected folder, or Inbox.
+
+    Args:
+        selected_folder (Folder): the selected task folder, or None for Inbox
+        include_recurring (bool): include recurring templates
+        include_archived (bool): include archived tasks
+    """
+    if request.session.get("tasks_all", False):
+        scope = Q(user=request.user)
     elif selected_folder:
-        queryset = Task.objects.filter(folder=selected_folder, is_recurring=False)
+        scope = Q(folder=selected_folder)
     else:
-        queryset = Task.objects.filter(
-            user=user, folder__isnull=True, is_recurring=False
-        )
+        scope = Q(user=request.user, folder__isnull=True)
+
+    if not include_recurring:
+        scope &= Q(is_recurring=False)
+    if not include_archived:
+        scope &= Q(archived=False)
+
+    return Task.objects.filter(scope)
+
+
+def _clean_filter(filter_data):
+    """Return a copy of the filter with priority as an int, or left out."""
+    filter_data = {**filter_data}
+    try:
+        priority = int(filter_data.pop("priority", None) or 0)
+    except (TypeError, ValueError):
+        priority = 0
+    if priority:
+        filter_data["priority"] = priority
+    return filter_data
+
+
+def _get_filter(request):
+    """Return the stored task filter.
+
+    Sessions saved before priorities were stored as ints still hold strings,
+    so the value is coerced on every read rather than trusted.
+    """
+    return _clean_filter(request.session.get("tasks_filter", {}))
+
+
+def _set_filter(request, filter_data):
+    """Store the task filter and drop any stashed Due view state.
+
+    The dict is replaced rather than mutated so the session always sees the
+    change and saves once.
+    """
+    request.session["tasks_filter"] = _clean_filter(filter_data)
+    request.session.pop("tasks_filter_stash", None)
+
+
+def _get_task_list_data(request, selected_folder, filter_data):
+    """Query the task rows, pagination and counts for the list partial.
+
+    Returns only plain values so the result can be cached.
+    """
+    user = request.user
+    queryset = _scoped_task_qs(request, selected_folder, include_archived=True)
 
-    filter_data = request.session.get("tasks_filter", {})
     filter_label = filter_data.get("filter_label", "")
     task_filter = TasksFilter(filter_data, queryset=queryset)
     tasks = task_filter.qs
@@ -39,53 +191,224 @@ def _get_task_list_context(request):
     if filter_label not in ("custom", "due"):
         tasks = tasks.filter(archived=False)
 
+    # across the whole filtered list, not just the current page
+    has_completed_tasks = tasks.filter(status=1).exists()
+
     # Apply sort — always push completed tasks to the bottom
     sort = filter_data.get("sort", "priority")
-    valid_sorts = (
+    if sort in _VALID_SORTS:
+        tasks = tasks.order_by("status", sort)
+
+    # only the columns tasks/row.html renders, plus its fragment cache key
+    tasks = tasks.values(
+        "id",
         "title",
-        "-title",
-        "due_date",
-        "-due_date",
-        "-created_at",
+        "status",
         "priority",
-        "-priority",
+        "completed_date",
+        "due_date",
+        "due_time",
+        "parent_task_id",
+        "updated_at",
     )
-    if sort in valid_sorts:
-        tasks = tasks.order_by("status", sort)
 
-    session_key = "tasks_page"
-    trigger_key = "tasksChanged"
-    pagination = CustomPaginator(tasks, 20, request, session_key)
+    pagination = CustomPaginator(tasks, 20, request, "tasks_page")
+    task_list = list(pagination.get_object_list())
 
-    task_list = pagination.get_object_list()
+    base_count_qs = Task.objects.filter(user=user, is_recurring=False, archived=False)
 
-    priority_value = filter_data.get("priority")
-    priority_value = (
-        int(priority_value) if priority_value not in (None, "", 0) else None
-    )
+    return {
+        "tasks": task_list,
+        "pagination": {
+            "number": pagination.number,
+            "has_previous": pagination.has_previous,
+            "has_next": pagination.has_next,
+            "previous_page_number": pagination.number - 1,
+            "next_page_number": pagination.number + 1,
+            "paginator": {"num_pages": pagination.num_pages},
+        },
+        "has_completed_tasks": has_completed_tasks,
+        "all_count": base_count_qs.count(),
+        "inbox_count": base_count_qs.filter(folder__isnull=True).count(),
+    }
 
-    base_count_qs = Task.objects.filter(user=user, is_recurring=False, archived=False)
+
+def _get_task_list_context(request):
+    """Helper to build context for task list partial."""
+    user = request.user
+    # the folder tree compares folder.user; editors are already prefetched
+    folders = get_task_folders(request).select_related("user")
+    selected_folder = _selected_folder(request)
+    tasks_folder_all = request.session.get("tasks_all", False)
+    filter_data = _get_filter(request)
+
+    # other users write to shared folders without bumping this user's version
+    shared = bool(selected_folder) and (
+        selected_folder.user_id != user.id or selected_folder.editors.exists()
+    )
+    if shared or not settings.CACHE_IS_SHARED:
+        task_data = _get_task_list_data(request, selected_folder, filter_data)
+    else:
+        key = _task_list_cache_key(
+            request, selected_folder, tasks_folder_all, filter_data
+        )
+        task_data = cache.get(key)
+        if task_data is None:
+            task_data = _get_task_list_data(request, selected_folder, filter_data)
+            cache.set(key, task_data, TASK_LIST_CACHE_TIMEOUT)
 
     return {
         "page": "tasks",
         "folders": folders,
         "selected_folder": selected_folder,
-        "tasks": task_list,
-        "pagination": pagination,
-        "session_key": session_key,
-        "trigger_key": trigger_key,
-        "filter_label": filter_label,
+        "session_key": "tasks_page",
+        "trigger_key": "tasksChanged",
+        "filter_label": filter_data.get("filter_label", ""),
         "tasks_folder_all": tasks_folder_all,
-        "has_completed_tasks": any(t.status == 1 for t in task_list),
-        "priority_choices": range(1, 11),
-        "priorities": list(range(1, 11)),
-        "priority_value": priority_value,
-        "current_sort": sort,
-        "all_count": base_count_qs.count(),
-        "inbox_count": base_count_qs.filter(folder__isnull=True).count(),
+        "priority_choices": _PRIORITY_CHOICES,
+        "priorities": _PRIORITY_LIST,
+        "priority_value": filter_data.get("priority"),
+        "current_sort": filter_data.get("sort", "priority"),
+        **task_data,
     }
 
 
+def _complete_tasks(tasks, mode):
+    """Complete tasks, archiving or deleting them per the completion mode.
+
+    Args:
+        tasks (QuerySet): the tasks to complete
+        mode (str): the user's task_completion_mode
+    """
+    if mode == "delete":
+        tasks.delete()
+    elif mode == "archive":
+        tasks.update(status=1, completed_date=date.today(), archived=True)
+    else:
+        tasks.update(status=1, completed_date=date.today())
+
+
+def _capitalize(title):
+    """Upper-case the first character of a task title."""
+    return title[0].upper() + title[1:]
+
+
+def _set_recurrence_fields(target, recurrence, due_date):
+    """Set recurrence_day/recurrence_month on target from a due date.
+
+    Args:
+        target (Task): the recurring template to update
+        recurrence (str): one of Task.RECURRENCE_CHOICES
+        due_date (date): the date the recurrence is anchored to
+    """
+    if not due_date or recurrence not in _RECURRENCE_FIELDS:
+        return
+    day, month = _RECURRENCE_FIELDS[recurrence](due_date)
+    target.recurrence_day = day
+    if month is not None:
+        target.recurrence_month = month
+
+
+def _sync_parent_task(task, parent_task, recurrence):
+    """Copy an edited recurring instance's changes onto its template.
+
+    Clearing the recurrence deletes the template and detaches the instance.
+    """
+    if not recurrence:
+        parent_task.delete()
+        task.parent_task = None
+        task.save()
+        return
+
+    task.save()
+    parent_task.folder = task.folder
+    parent_task.title = task.title
+    parent_task.priority = task.priority
+    parent_task.due_time = task.due_time
+    parent_task.recurrence_type = recurrence
+    _set_recurrence_fields(parent_task, recurrence, task.due_date)
+    parent_task.save(
+        update_fields=[
+            "folder",
+            "title",
+            "priority",
+            "due_time",
+            "recurrence_type",
+            "recurrence_day",
+            "recurrence_month",
+            "updated_at",
+        ]
+    )
+
+
+def _new_instance(parent, due_date):
+    """Build an unsaved pending instance of a recurring template."""
+    return Task(
+        user_id=parent.user_id,
+        folder_id=parent.folder_id,
+        title=parent.title,
+        priority=parent.priority,
+        status=0,
+        due_date=due_date,
+        due_time=parent.due_time,
+        parent_task=parent,
+    )
+
+
+def _sync_latest_instance(task):
+    """Copy an edited template's changes onto its latest pending instance."""
+    latest_instance = (
+        Task.objects.filter(parent_task=task, status=0).order_by("-due_date").first()
+    )
+    if latest_instance:
+        latest_instance.folder = task.folder
+        latest_instance.title = task.title
+        latest_instance.priority = task.priority
+        latest_instance.due_time = task.due_time
+        latest_instance.save(
+            update_fields=["folder", "title", "priority", "due_time", "updated_at"]
+        )
+
+
+@transaction.atomic
+def _apply_recurrence(task, parent_task, recurrence, was_recurring):
+    """Save an edited task and carry its recurrence changes through.
+
+    Args:
+        task (Task): the edited task, not yet saved
+        parent_task (Task): the task's template, captured before the edit
+        recurrence (str): the submitted recurrence, or empty for none
+        was_recurring (bool): whether the task was a template before the edit
+    """
+    # editing a recurring instance: sync changes to the template
+    if parent_task:
+        _sync_parent_task(task, parent_task, recurrence)
+        return
+
+    # editing a regular task or a template
+    if recurrence:
+        task.is_recurring = True
+        task.recurrence_type = recurrence
+        _set_recurrence_fields(task, recurrence, task.due_date)
+    else:
+        task.is_recurring = False
+        task.recurrence_type = None
+        task.recurrence_day = None
+        task.recurrence_month = None
+
+    # stamped here so the template's own save covers it
+    becomes_recurring = task.is_recurring and not was_recurring
+    if becomes_recurring:
+        task.last_generated = date.today()
+
+    task.save()
+
+    if becomes_recurring:
+        _new_instance(task, task.due_date).save()
+    elif task.is_recurring and was_recurring:
+        _sync_latest_instance(task)
+
+
 @login_required
 def index(request):
     """Display a list of folders and one or more lists of tasks.
@@ -115,21 +438,33 @@ def status(request, id, origin="tasks"):
         in which case, the user should be returned to the page of origin.
     """
 
-    task = get_object_or_404(Task, pk=id)
-    if task.status == 1:
-        task.status = 0
-        task.completed_date = None
-        task.save()
+    tasks = _accessible_tasks(request).filter(pk=id)
+    owner_ids = _task_owner_ids(tasks)
+    mode = request.user.task_completion_mode
+
+    if mode == "delete":
+        # a pending task is deleted outright, a completed one is reopened
+        deleted, _ = tasks.exclude(status=1).delete()
+        if not deleted and not tasks.update(status=0, completed_date=None):
+            raise Http404("Record not found.")
     else:
-        task.status = 1
-        task.completed_date = date.today()
-        mode = request.user.task_completion_mode
-        if mode == "delete":
-            task.delete()
-        else:
-            if mode == "archive":
-                task.archived = True
-            task.save()
+        # toggle in a single UPDATE; each CASE reads the pre-update status
+        fields = {
+            "status": Case(When(status=1, then=Value(0)), default=Value(1)),
+            "completed_date": Case(
+                When(status=1, then=None),
+                default=Value(date.today()),
+                output_field=DateField(),
+            ),
+        }
+        if mode == "archive":
+            fields["archived"] = Case(
+                When(status=1, then=F("archived")), default=Value(True)
+            )
+        if not tasks.update(**fields):
+            raise Http404("Record not found.")
+
+    _tasks_changed(request.user, owner_ids)
     return redirect(origin)
 
 
@@ -147,17 +482,16 @@ def add(request):
         task = Task()
 
         task.user = request.user
-        task.title = request.POST.get("title")
-        task.title = task.title[0].upper() + task.title[1:]
+        task.title = _capitalize(request.POST.get("title"))
 
         try:
-            folder = Folder.objects.filter(pk=request.POST.get("folder_id")).get()
-            task.folder = folder
-            task.save()
+            task.folder = Folder.objects.get(pk=request.POST.get("folder_id"))
+        except (Folder.DoesNotExist, ValueError, TypeError):
+            pass
 
-        except ValueError:
-            task.save()
+        task.save()
 
+        _tasks_changed(request.user)
         return redirect("tasks")
 
 
@@ -176,10 +510,7 @@ def edit(request, id):
     user = request.user
 
     if request.method == "POST":
-        try:
-            task = Task.objects.filter(pk=id).get()
-        except ObjectDoesNotExist:
-            raise Http404("Record not found.")
+        task = get_object_or_404(Task, pk=id, user=user)
 
         # Check if this task was already recurring before the edit
         was_recurring = task.is_recurring
@@ -189,95 +520,15 @@ def edit(request, id):
         if form.is_valid():
             task = form.save(commit=False)
             task.user = user
-            task.title = task.title[0].upper() + task.title[1:]
+            task.title = _capitalize(task.title)
             recurrence = form.cleaned_data.get("recurrence")
-
-            # If editing a recurring instance, sync changes to the template
-            if parent_task:
-                task.save()
-                parent_task.folder = task.folder
-                parent_task.title = task.title
-                parent_task.priority = task.priority
-                parent_task.due_time = task.due_time
-                if recurrence:
-                    parent_task.recurrence_type = recurrence
-                    if task.due_date:
-                        if recurrence == "daily":
-                            parent_task.recurrence_day = None
-                        elif recurrence == "monthly":
-                            parent_task.recurrence_day = task.due_date.day
-                        elif recurrence == "weekly":
-                            parent_task.recurrence_day = task.due_date.weekday()
-                        elif recurrence == "yearly":
-                            parent_task.recurrence_day = task.due_date.day
-                            parent_task.recurrence_month = task.due_date.month
-                    parent_task.save()
-                else:
-                    # Recurrence removed - delete the template
-                    parent_task.delete()
-                    task.parent_task = None
-                    task.save()
-
-            # Editing a regular task or a template
-            else:
-                if recurrence:
-                    task.is_recurring = True
-                    task.recurrence_type = recurrence
-
-                    # Set recurrence_day based on due_date
-                    if task.due_date:
-                        if recurrence == "daily":
-                            task.recurrence_day = None
-                        elif recurrence == "monthly":
-                            task.recurrence_day = task.due_date.day
-                        elif recurrence == "weekly":
-                            task.recurrence_day = task.due_date.weekday()
-                        elif recurrence == "yearly":
-                            task.recurrence_day = task.due_date.day
-                            task.recurrence_month = task.due_date.month
-                else:
-                    task.is_recurring = False
-                    task.recurrence_type = None
-                    task.recurrence_day = None
-                    task.recurrence_month = None
-
-                task.save()
-
-                # If task just became recurring, create the first instance immediately
-                if task.is_recurring and not was_recurring:
-                    from datetime import date
-
-                    Task.objects.create(
-                        user=task.user,
-                        folder=task.folder,
-                        title=task.title,
-                        priority=task.priority,
-                        status=0,
-                        due_date=task.due_date,
-                        due_time=task.due_time,
-                        parent_task=task,
-                    )
-                    task.last_generated = date.today()
-                    task.save(update_fields=["last_generated"])
-
-                # If editing a recurring template, update the most recent incomplete instance
-                elif task.is_recurring and was_recurring:
-                    latest_instance = (
-                        Task.objects.filter(parent_task=task, status=0)
-                        .order_by("-due_date")
-                        .first()
-                    )
-                    if latest_instance:
-                        latest_instance.folder = task.folder
-                        latest_instance.title = task.title
-                        latest_instance.priority = task.priority
-                        latest_instance.due_time = task.due_time
-                        latest_instance.save()
+            _apply_recurrence(task, parent_task, recurrence, was_recurring)
+            _tasks_changed(user)
 
         return redirect("tasks")
 
     else:
-        task = get_object_or_404(Task, pk=id)
+        task = get_object_or_404(Task, pk=id, user=user)
         folders = get_task_folders(request)
         try:
             selected_folder = folders.filter(id=task.folder.id).get()
@@ -317,21 +568,20 @@ def delete(request, id):
     """
     task = get_object_or_404(Task, pk=id, user=request.user)
     task.delete()
+    _tasks_changed(request.user)
     return redirect("tasks")
 
 
 @login_required
 def clear(request):
     """Archive all completed tasks in the active folder."""
-    selected_folder = select_folder(request, "tasks")
-
-    if selected_folder:
-        Task.objects.filter(folder=selected_folder, status=1).update(archived=True)
-    else:
-        Task.objects.filter(user=request.user, folder__isnull=True, status=1).update(
-            archived=True
-        )
-
+    selected_folder = _selected_folder(request)
+    qs = _scoped_task_qs(request, selected_folder, include_recurring=True).filter(
+        status=1
+    )
+    owner_ids = _task_owner_ids(qs)
+    qs.update(archived=True)
+    _tasks_changed(request.user, owner_ids)
     return redirect("/tasks/")
 
 
@@ -340,7 +590,6 @@ def add_editor(request, folder_id, user_id):
     folder = get_object_or_404(Folder, pk=folder_id)
     user = get_object_or_404(CustomUser, pk=user_id)
     folder.editors.add(user)
-    folder.save()
     return redirect("/tasks/")
 
 
@@ -349,7 +598,6 @@ def remove_editor(request, folder_id, user_id):
     folder = get_object_or_404(Folder, pk=folder_id)
     user = get_object_or_404(CustomUser, pk=user_id)
     folder.editors.remove(user)
-    folder.save()
     return redirect("/tasks/")
 
 
@@ -361,7 +609,7 @@ def tasks_all(request):
     """Select 'All' folder view and return updated tasks with folders OOB."""
     request.session["tasks_all"] = True
     request.user.tasks_folder = 0
-    request.user.save()
+    request.user.save(update_fields=["tasks_folder"])
     context = _get_task_list_context(request)
     return render(request, "tasks/tasks-with-folders-oob.html", context)
 
@@ -369,16 +617,15 @@ def tasks_all(request):
 @login_required
 def tasks_due(request):
     """Toggle quick filter: stash current filter and show due tasks, or restore."""
-    current_filter = request.session.get("tasks_filter", {})
+    current_filter = _get_filter(request)
     stash = request.session.get("tasks_filter_stash")
 
     if current_filter.get("filter_label") == "due" and stash is not None:
         # Restore stashed state
-        request.session["tasks_filter"] = stash["tasks_filter"]
+        _set_filter(request, stash["tasks_filter"])
         request.session["tasks_all"] = stash["tasks_all"]
         request.user.tasks_folder = stash["tasks_folder"]
-        request.user.save()
-        request.session.pop("tasks_filter_stash", None)
+        request.user.save(update_fields=["tasks_folder"])
     else:
         # Stash current state and apply due filter
         request.session["tasks_filter_stash"] = {
@@ -388,7 +635,7 @@ def tasks_due(request):
         }
         request.session["tasks_all"] = True
         request.user.tasks_folder = 0
-        request.user.save()
+        request.user.save(update_fields=["tasks_folder"])
         request.session["tasks_filter"] = {
             "filter_label": "due",
             "status": "Pending",
@@ -411,15 +658,13 @@ def task_list(request):
 def task_filter(request):
     """Display or apply task filter."""
     if request.method == "POST":
-        filter_data = {
-            k: v for k, v in request.POST.items() if k != "csrfmiddlewaretoken"
-        }
+        filter_data = request.POST.dict()
+        filter_data.pop("csrfmiddlewaretoken", None)
         filter_data["filter_label"] = "custom"
-        request.session["tasks_filter"] = filter_data
-        request.session.pop("tasks_filter_stash", None)
+        _set_filter(request, filter_data)
         return HttpResponse(status=204, headers={"HX-Trigger": "tasksChanged"})
 
-    filter_data = request.session.get("tasks_filter", {})
+    filter_data = _get_filter(request)
     task_filter = TasksFilter(filter_data)
     return render(
         request,
@@ -434,7 +679,7 @@ def task_filter(request):
 @login_required
 def tasks_order_by(request, order):
     """Sort tasks by column header click."""
-    filter_data = request.session.get("tasks_filter", {})
+    filter_data = _get_filter(request)
     current_sort = filter_data.get("sort", "priority")
 
     if current_sort == order:
@@ -445,10 +690,8 @@ def tasks_order_by(request, order):
         new_sort = order
 
     filter_data["sort"] = new_sort
-    request.session["tasks_filter"] = filter_data
+    _set_filter(request, filter_data)
     request.session["tasks_page"] = 1
-    request.session.pop("tasks_filter_stash", None)
-    request.session.modified = True
 
     return HttpResponse(status=204, headers={"HX-Trigger": "tasksChanged"})
 
@@ -470,15 +713,15 @@ def add_htmx(request):
         task.title = request.POST.get("title", "").strip()
 
         if task.title:
-            task.title = task.title[0].upper() + task.title[1:]
+            task.title = _capitalize(task.title)
 
             try:
-                folder = Folder.objects.filter(pk=request.POST.get("folder_id")).get()
-                task.folder = folder
-            except (ValueError, Folder.DoesNotExist):
+                task.folder = Folder.objects.get(pk=request.POST.get("folder_id"))
+            except (Folder.DoesNotExist, ValueError, TypeError):
                 pass
 
             task.save()
+            _tasks_changed(request.user)
 
     context = _get_task_list_context(request)
     response = render(request, "tasks/list.html", context)
@@ -490,7 +733,7 @@ def add_htmx(request):
 def task_form(request, id):
     """Return task edit form in modal, or process form submission."""
     user = request.user
-    task = get_object_or_404(Task, pk=id)
+    task = get_object_or_404(_accessible_tasks(request), pk=id)
     folders = get_task_folders(request)
 
     if request.method == "POST":
@@ -502,9 +745,10 @@ def task_form(request, id):
         form = TaskForm(request.POST, instance=task, use_required_attribute=False)
         form.fields["folder"].queryset = folders
         if form.is_valid():
+            owner_ids = _task_owner_ids(Task.objects.filter(pk=task.pk))
             task = form.save(commit=False)
             task.user = user
-            task.title = task.title[0].upper() + task.title[1:]
+            task.title = _capitalize(task.title)
             recurrence = form.cleaned_data.get("recurrence")
 
             # Update completed_date when status changes
@@ -513,79 +757,8 @@ def task_form(request, id):
             elif task.status != 1 and old_status == 1:
                 task.completed_date = None
 
-            # If editing a recurring instance, sync changes to the template
-            if parent_task:
-                task.save()
-                parent_task.folder = task.folder
-                parent_task.title = task.title
-                parent_task.priority = task.priority
-                parent_task.due_time = task.due_time
-                if recurrence:
-                    parent_task.recurrence_type = recurrence
-                    if task.due_date:
-                        if recurrence == "daily":
-                            parent_task.recurrence_day = None
-                        elif recurrence == "monthly":
-                            parent_task.recurrence_day = task.due_date.day
-                        elif recurrence == "weekly":
-                            parent_task.recurrence_day = task.due_date.weekday()
-                        elif recurrence == "yearly":
-                            parent_task.recurrence_day = task.due_date.day
-                            parent_task.recurrence_month = task.due_date.month
-                    parent_task.save()
-                else:
-                    parent_task.delete()
-                    task.parent_task = None
-                    task.save()
-            else:
-                if recurrence:
-                    task.is_recurring = True
-                    task.recurrence_type = recurrence
-                    if task.due_date:
-                        if recurrence == "daily":
-                            task.recurrence_day = None
-                        elif recurrence == "monthly":
-                            task.recurrence_day = task.due_date.day
-                        elif recurrence == "weekly":
-                            task.recurrence_day = task.due_date.weekday()
-                        elif recurrence == "yearly":
-                            task.recurrence_day = task.due_date.day
-                            task.recurrence_month = task.due_date.month
-                else:
-                    task.is_recurring = False
-                    task.recurrence_type = None
-                    task.recurrence_day = None
-                    task.recurrence_month = None
-
-                task.save()
-
-                if task.is_recurring and not was_recurring:
-                    from datetime import date
-
-                    Task.objects.create(
-                        user=task.user,
-                        folder=task.folder,
-                        title=task.title,
-                        priority=task.priority,
-                        status=0,
-                        due_date=task.due_date,
-                        due_time=task.due_time,
-                        parent_task=task,
-                    )
-                    task.last_generated = date.today()
-                    task.save(update_fields=["last_generated"])
-                elif task.is_recurring and was_recurring:
-                    latest_instance = (
-                        Task.objects.filter(parent_task=task, status=0)
-                        .order_by("-due_date")
-                        .first()
-                    )
-                    if latest_instance:
-                        latest_instance.folder = task.folder
-                        latest_instance.title = task.title
-                        latest_instance.priority = task.priority
-                        latest_instance.due_time = task.due_time
-                        latest_instance.save()
+            _apply_recurrence(task, parent_task, recurrence, was_recurring)
+            _tasks_changed(user, owner_ids)
 
             return HttpResponse(status=204, headers={"HX-Trigger": "tasksChanged"})
 
@@ -612,43 +785,38 @@ def task_form(request, id):
 @login_required
 def status_htmx(request, id):
     """Toggle task status via htmx and return updated list."""
-    task = get_object_or_404(Task, pk=id)
-    if task.status == 1:
-        task.status = 0
-        task.completed_date = None
-        task.save()
+    tasks = _accessible_tasks(request).filter(pk=id)
+    task = tasks.values("status", "parent_task_id").first()
+    if task is None:
+        raise Http404("Record not found.")
+    owner_ids = _task_owner_ids(tasks)
+
+    if task["status"] == 1:
+        tasks.update(status=0, completed_date=None)
     else:
-        task.status = 1
-        task.completed_date = date.today()
-        mode = request.user.task_completion_mode
-        if mode == "delete":
-            task.delete()
-        else:
-            if mode == "archive":
-                task.archived = True
-            task.save()
+        _complete_tasks(tasks, request.user.task_completion_mode)
 
     # Generate next recurring instance on completion
-    if task.status == 1 and task.parent_task:
-        parent = task.parent_task
-        if parent.is_recurring and not parent.archived:
+    if task["status"] != 1 and task["parent_task_id"]:
+        parent = (
+            Task.objects.filter(
+                pk=task["parent_task_id"], is_recurring=True, archived=False
+            )
+            .only("id", "user_id", "folder_id", "title", "priority", "due_time")
+            .first()
+        )
+        if parent:
             has_pending = Task.objects.filter(
                 parent_task=parent, status=0, archived=False
             ).exists()
             if not has_pending:
-                Task.objects.create(
-                    user=parent.user,
-                    folder=parent.folder,
-                    title=parent.title,
-                    priority=parent.priority,
-                    status=0,
-                    due_date=date.today(),
-                    due_time=parent.due_time,
-                    parent_task=parent,
-                )
-                parent.last_generated = date.today()
-                parent.save(update_fields=["last_generated"])
+                with transaction.atomic():
+                    Task.objects.bulk_create([_new_instance(parent, date.today())])
+                    Task.objects.filter(pk=parent.pk).update(
+                        last_generated=date.today()
+                    )
 
+    _tasks_changed(request.user, owner_ids)
     context = _get_task_list_context(request)
     response = render(request, "tasks/list.html", context)
     response["HX-Trigger"] = "tasksChanged"
@@ -657,15 +825,16 @@ def status_htmx(request, id):
 
 @login_required
 def priority_htmx(request, id):
-    """Update task priority via htmx and return updated list."""
-    task = get_object_or_404(Task, pk=id)
+    """Update task priority via htmx and trigger a list refresh."""
     priority = request.GET.get("priority")
     if priority:
-        task.priority = int(priority)
-        task.save(update_fields=["priority"])
+        tasks = _accessible_tasks(request).filter(pk=id)
+        owner_ids = _task_owner_ids(tasks)
+        if not tasks.update(priority=int(priority)):
+            raise Http404("Record not found.")
+        _tasks_changed(request.user, owner_ids)
 
-    context = _get_task_list_context(request)
-    return render(request, "tasks/list.html", context)
+    return HttpResponse(status=204, headers={"HX-Trigger": "tasksChanged"})
 
 
 @login_required
@@ -673,6 +842,7 @@ def delete_htmx(request, id):
     """Delete task via htmx and close modal."""
     task = get_object_or_404(Task, pk=id, user=request.user)
     task.delete()
+    _tasks_changed(request.user)
     return HttpResponse(status=204, headers={"HX-Trigger": "tasksChanged"})
 
 
@@ -680,31 +850,15 @@ def delete_htmx(request, id):
 def bulk_status_htmx(request):
     """Set all visible tasks to complete or pending."""
     new_status = int(request.GET.get("status", 0))
-    tasks_folder_all = request.session.get("tasks_all", False)
-    selected_folder = select_folder(request, "tasks")
+    qs = _scoped_task_qs(request, _selected_folder(request))
+    owner_ids = _task_owner_ids(qs)
 
-    if tasks_folder_all:
-        qs = Task.objects.filter(user=request.user, is_recurring=False, archived=False)
-    elif selected_folder:
-        qs = Task.objects.filter(
-            folder=selected_folder, is_recurring=False, archived=False
-        )
-    else:
-        qs = Task.objects.filter(
-            user=request.user, folder__isnull=True, is_recurring=False, archived=False
-        )
-
-    if new_status == 1:
-        pending = qs.filter(status=0)
-        mode = request.user.task_completion_mode
-        if mode == "delete":
-            pending.delete()
-        elif mode == "archive":
-            pending.update(status=1, completed_date=date.today(), archived=True)
+    with transaction.atomic():
+        if new_status == 1:
+            _complete_tasks(qs.filter(status=0), request.user.task_completion_mode)
         else:
-            pending.update(status=1, completed_date=date.today())
-    else:
-        qs.filter(status=1).update(status=0, completed_date=None)
+            qs.filter(status=1).update(status=0, completed_date=None)
+    _tasks_changed(request.user, owner_ids)
 
     context = _get_task_list_context(request)
     response = render(request, "tasks/list.html", context)
@@ -715,17 +869,13 @@ def bulk_status_htmx(request):
 @login_required
 def clear_htmx(request):
     """Archive completed tasks via htmx and return updated list."""
-    tasks_folder_all = request.session.get("tasks_all", False)
-    selected_folder = select_folder(request, "tasks")
-
-    if tasks_folder_all:
-        Task.objects.filter(user=request.user, status=1).update(archived=True)
-    elif selected_folder:
-        Task.objects.filter(folder=selected_folder, status=1).update(archived=True)
-    else:
-        Task.objects.filter(user=request.user, folder__isnull=True, status=1).update(
-            archived=True
-        )
+    selected_folder = _selected_folder(request)
+    qs = _scoped_task_qs(request, selected_folder, include_recurring=True).filter(
+        status=1
+    )
+    owner_ids = _task_owner_ids(qs)
+    qs.update(archived=True)
+    _tasks_changed(request.user, owner_ids)
 
     context = _get_task_list_context(request)
     response = render(request, "tasks/list.html", context)
@@ -736,15 +886,13 @@ def clear_htmx(request):
 @login_required
 def delete_completed_htmx(request):
     """Delete completed tasks via htmx and return updated list."""
-    tasks_folder_all = request.session.get("tasks_all", False)
-    selected_folder = select_folder(request, "tasks")
-
-    if tasks_folder_all:
-        Task.objects.filter(user=request.user, status=1).delete()
-    elif selected_folder:
-        Task.objects.filter(folder=selected_folder, status=1).delete()
-    else:
-        Task.objects.filter(user=request.user, folder__isnull=True, status=1).delete()
+    selected_folder = _selected_folder(request)
+    qs = _scoped_task_qs(
+        request, selected_folder, include_recurring=True, include_archived=True
+    ).filter(status=1)
+    owner_ids = _task_owner_ids(qs)
+    qs.delete()
+    _tasks_changed(request.user, owner_ids)
 
     context = _get_task_list_context(request)
     response = render(request, "tasks/list.html", context)
@@ -755,11 +903,9 @@ def delete_completed_htmx(request):
 @login_required
 def filter_priority_htmx(request, priority_value):
     """Filter tasks by priority level via htmx."""
-    filter_data = request.session.get("tasks_filter", {})
-    filter_data["priority"] = "" if priority_value == 0 else priority_value
-    request.session["tasks_filter"] = filter_data
-    request.session.pop("tasks_filter_stash", None)
-    request.session.modified = True
+    filter_data = _get_filter(request)
+    filter_data["priority"] = priority_value
+    _set_filter(request, filter_data)
 
     context = _get_task_list_context(request)
     return render(request, "tasks/list.html", context)
@@ -768,17 +914,12 @@ def filter_priority_htmx(request, priority_value):
 @login_required
 def move_folder_htmx(request):
     """Move completed tasks to a different folder via htmx."""
-    tasks_folder_all = request.session.get("tasks_all", False)
-    selected_folder = select_folder(request, "tasks")
+    selected_folder = _selected_folder(request)
+    qs = _scoped_task_qs(request, selected_folder, include_recurring=True).filter(
+        status=1
+    )
 
-    if tasks_folder_all:
-        qs = Task.objects.filter(user=request.user, status=1, archived=False)
-    elif selected_folder:
-        qs = Task.objects.filter(folder=selected_folder, status=1, archived=False)
-    else:
-        qs = Task.objects.filter(
-            user=request.user, folder__isnull=True, status=1, archived=False
-        )
+    owner_ids = _task_owner_ids(qs)
 
     folder_id = request.GET.get("folder_id", "")
     if folder_id:
@@ -786,6 +927,7 @@ def move_folder_htmx(request):
         qs.update(folder=folder)
     else:
         qs.update(folder=None)
+    _tasks_changed(request.user, owner_ids)
 
     context = _get_task_list_context(request)
     response = render(request, "tasks/list.html", context)
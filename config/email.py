@@ -1,12 +1,39 @@
 """Email utility for task reminders."""
 
+import functools
+import io
 import logging
+import smtplib
 
 from django.conf import settings
-from django.core.mail import send_mail
+from django.core.mail import BadHeaderError, EmailMessage, get_connection, send_mail
 
 logger = logging.getLogger(__name__)
 
+# a batch this large stops once more than a third of its sends have failed,
+# since that points at the mail server rather than individual recipients
+BATCH_ABORT_MIN_SIZE = 30
+
+_NO_ADDRESS = "User has no email address"
+
+_DATE_FMT = "%B %-d, %Y"
+_TIME_FMT = "%-I:%M %p"
+
+_SUBJECT_FMT = {
+    "due_today": "Task Due Today: {}",
+    "due_soon": "Task Due Soon: {}",
+    "overdue": "Overdue Task: {}",
+}
+_DEFAULT_SUBJECT = "Task Reminder: {}"
+
+# reminder bodies, filled by _build_body; each *_line is empty or ends in \n
+_REMINDER_TAIL = "{due_date_line}{due_time_line}{folder_line}\n-- {site}"
+_REMINDER_BODIES = {
+    "due_today": 'Your task "{title}" is due today.\n\n' + _REMINDER_TAIL,
+    "due_soon": 'Your task "{title}" is due soon at {due_time}.\n\n' + _REMINDER_TAIL,
+    "overdue": 'Your task "{title}" is overdue.\n\n' + _REMINDER_TAIL,
+}
+
 
 def send_task_reminder_email(user, task, reminder_type):
     """Send a task reminder email.
@@ -19,32 +46,97 @@ def send_task_reminder_email(user, task, reminder_type):
     Returns:
         dict with 'success' boolean and optional 'error'
     """
-    recipient = user.notification_email or user.email
-    if not recipient:
-        return {"success": False, "error": "User has no email address"}
+    return send_task_reminders_batch([(user, task, reminder_type)])[0]
 
-    subject_map = {
-        "due_today": f"Task Due Today: {task.title}",
-        "due_soon": f"Task Due Soon: {task.title}",
-        "overdue": f"Overdue Task: {task.title}",
-    }
-    subject = subject_map.get(reminder_type, f"Task Reminder: {task.title}")
 
-    body = _build_body(task, reminder_type)
+def send_task_reminders_batch(reminders, on_result=None):
+    """Send task reminder emails over a single SMTP connection.
 
+    Args:
+        reminders: iterable of (user, task, reminder_type) tuples
+        on_result: optional callable(reminder, result), called as each result
+            is known so callers can record it before the batch finishes
+
+    Returns:
+        list of result dicts, one per reminder, in order
+    """
+    reminders = list(reminders)
+    results = []
+
+    def record(reminder, result):
+        results.append(result)
+        if on_result:
+            on_result(reminder, result)
+
+    def fail_rest(error):
+        for reminder in reminders[len(results) :]:
+            record(reminder, {"success": False, "error": error})
+        return results
+
+    # nothing to deliver, so don't pay for an SMTP handshake
+    if not any(_recipient(user) for user, _, _ in reminders):
+        return fail_rest(_NO_ADDRESS)
+
+    connection = get_connection(fail_silently=False)
     try:
-        send_mail(
-            subject, body, settings.SERVER_EMAIL, [recipient], fail_silently=False
-        )
+        connection.open()
+    except (smtplib.SMTPException, OSError) as e:
+        logger.error("Failed to open mail connection: %s", e)
+        return fail_rest(str(e))
+
+    can_abort = len(reminders) >= BATCH_ABORT_MIN_SIZE
+    max_failures = len(reminders) // 3
+    failures = 0
+    try:
+        for reminder in reminders:
+            result = _send_reminder(connection, *reminder)
+            record(reminder, result)
+            if not result["success"]:
+                failures += 1
+            if can_abort and failures > max_failures:
+                logger.error("Reminder batch aborted after %d failed sends", failures)
+                break
+    finally:
+        connection.close()
+
+    return fail_rest("Batch aborted")
+
+
+def _send_reminder(connection, user, task, reminder_type):
+    """Send one task reminder through an open connection."""
+    recipient = _recipient(user)
+    if not recipient:
+        return {"success": False, "error": _NO_ADDRESS}
+
+    message = _build_reminder_message(recipient, task, reminder_type)
+    try:
+        try:
+            connection.send_messages([message])
+        except smtplib.SMTPServerDisconnected:
+            # the server dropped the connection mid-batch; reconnect once
+            connection.close()
+            connection.open()
+            connection.send_messages([message])
         logger.info(
-            f"Reminder sent to {recipient} for task {task.id} ({reminder_type})"
+            "Reminder sent to %s for task %s (%s)", recipient, task.id, reminder_type
         )
         return {"success": True}
-    except Exception as e:
-        logger.error(f"Failed to send reminder to {recipient} for task {task.id}: {e}")
+    # a bad header (e.g. a newline in the title) only fails this reminder
+    except (smtplib.SMTPException, OSError, BadHeaderError) as e:
+        logger.error(
+            "Failed to send reminder to %s for task %s: %s", recipient, task.id, e
+        )
         return {"success": False, "error": str(e)}
 
 
+def _build_reminder_message(recipient, task, reminder_type):
+    """Build the reminder EmailMessage for one task."""
+    subject = _SUBJECT_FMT.get(reminder_type, _DEFAULT_SUBJECT).format(task.title)
+    body = _build_body(task, reminder_type)
+
+    return EmailMessage(subject, body, settings.SERVER_EMAIL, [recipient])
+
+
 def send_past_due_digest_email(user, tasks):
     """Send a single digest email listing all overdue tasks.
 
@@ -55,22 +147,18 @@ def send_past_due_digest_email(user, tasks):
     Returns:
         dict with 'success' boolean and optional 'error'
     """
-    recipient = user.notification_email or user.email
+    recipient = _recipient(user)
     if not recipient:
-        return {"success": False, "error": "User has no email address"}
+        return {"success": False, "error": _NO_ADDRESS}
 
-    tasks = list(tasks)
-    lines = ["You have the following past due tasks:", ""]
+    count = 0
+    buf = io.StringIO()
+    buf.write("You have the following past due tasks:\n\n")
     for task in tasks:
-        parts = [f"- {task.title}"]
-        if task.due_date:
-            parts.append(f"(due {task.due_date.strftime('%B %-d, %Y')})")
-        if task.folder:
-            parts.append(f"[{task.folder.name}]")
-        lines.append(" ".join(parts))
-    lines.append("")
-    lines.append(f"-- {settings.SITE_NAME}")
-    body = "\n".join(lines)
+        count += 1
+        buf.write(f"{_format_digest_line(task)}\n")
+    buf.write(f"\n-- {settings.SITE_NAME}")
+    body = buf.getvalue()
 
     try:
         send_mail(
@@ -80,31 +168,42 @@ def send_past_due_digest_email(user, tasks):
             [recipient],
             fail_silently=False,
         )
-        logger.info(f"Past due digest sent to {recipient} ({len(tasks)} tasks)")
+        logger.info("Past due digest sent to %s (%d tasks)", recipient, count)
         return {"success": True}
-    except Exception as e:
-        logger.error(f"Failed to send past due digest to {recipient}: {e}")
+    except (smtplib.SMTPException, OSError) as e:
+        logger.error("Failed to send past due digest to %s: %s", recipient, e)
         return {"success": False, "error": str(e)}
 
 
+def _recipient(user):
+    """Return the address a user's notifications go to, or empty."""
+    return user.notification_email or user.email
+
+
+def _format_digest_line(task):
+    """Format one overdue task as a digest bullet."""
+    due = f" (due {_format_date(task.due_date)})" if task.due_date else ""
+    folder = f" [{task.folder.name}]" if task.folder else ""
+    return f"- {task.title}{due}{folder}"
+
+
 def _build_body(task, reminder_type):
     """Build plain text email body."""
-    lines = []
-    if reminder_type == "due_today":
-        lines.append(f'Your task "{task.title}" is due today.')
-    elif reminder_type == "due_soon":
-        time_str = task.due_time.strftime("%-I:%M %p") if task.due_time else ""
-        lines.append(f'Your task "{task.title}" is due soon at {time_str}.')
-    elif reminder_type == "overdue":
-        lines.append(f'Your task "{task.title}" is overdue.')
-
-    lines.append("")
-    if task.due_date:
-        lines.append(f"Due date: {task.due_date.strftime('%B %-d, %Y')}")
-    if task.due_time:
-        lines.append(f"Due time: {task.due_time.strftime('%-I:%M %p')}")
-    if task.folder:
-        lines.append(f"Folder: {task.folder.name}")
-    lines.append("")
-    lines.append(f"-- {settings.SITE_NAME}")
-    return "\n".join(lines)
+    due_date = _format_date(task.due_date) if task.due_date else ""
+    due_time = task.due_time.strftime(_TIME_FMT) if task.due_time else ""
+    fields = {
+        "title": task.title,
+        "due_time": due_time,
+        "due_date_line": f"Due date: {due_date}\n" if due_date else "",
+        "due_time_line": f"Due time: {due_time}\n" if due_time else "",
+        "folder_line": f"Folder: {task.folder.name}\n" if task.folder else "",
+        "site": settings.SITE_NAME,
+    }
+    template = _REMINDER_BODIES.get(reminder_type, "\n" + _REMINDER_TAIL)
+    return template.format_map(fields)
+
+
+@functools.lru_cache(maxsize=128)
+def _format_date(value):
+    """Format a due date; digests repeat the same few dates many times."""
+    return value.strftime(_DATE_FMT)
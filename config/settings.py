@@ -141,6 +141,19 @@ DATABASES = {
 }
 
 
+# Password hashing
+# Django's default list with Argon2 moved first; hashes from the others still
+# verify and are upgraded on the user's next login
+
+PASSWORD_HASHERS = [
+    "django.contrib.auth.hashers.Argon2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+    "django.contrib.auth.hashers.ScryptPasswordHasher",
+]
+
+
 # Password validation
 # https://docs.djangoproject.com/en/3.2/ref/settings/#auth-password-validators
 
@@ -287,6 +300,24 @@ SESSION_COOKIE_AGE = 1209600 * 4
 
 SESSION_SAVE_EVERY_REQUEST = True
 
+# Cache — point CACHE_URL at redis/memcached in production, e.g.
+# CACHE_URL=redis://127.0.0.1:6379/1
+CACHES = {"default": env.cache("CACHE_URL", default="locmemcache://")}
+
+# a local-memory cache lives inside one process, so gunicorn workers can't share it
+CACHE_IS_SHARED = CACHES["default"]["BACKEND"] not in (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+)
+
+# serve session reads from a shared cache, falling back to the database on a miss;
+# a per-process cache could hand one worker a session another worker has changed
+SESSION_ENGINE = (
+    "django.contrib.sessions.backends.cached_db"
+    if CACHE_IS_SHARED
+    else "django.contrib.sessions.backends.db"
+)
+
 
 class CustomFormRenderer(TemplatesSetting):
     form_template_name = "components/form-fields.html"
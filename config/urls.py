@@ -264,6 +264,16 @@ urlpatterns = [
         user_settings.switch_status,
         name="settings-switch-status",
     ),
+    path(
+        "settings/users/bulk/change-role/<str:role>/",
+        user_settings.bulk_change_role,
+        name="settings-bulk-change-role",
+    ),
+    path(
+        "settings/users/bulk/switch-status/",
+        user_settings.bulk_switch_status,
+        name="settings-bulk-switch-status",
+    ),
     path("settings/users/add/", user_settings.add_user, name="settings-add-user"),
     path(
         "settings/users/edit/<int:user_id>/",
@@ -3,8 +3,14 @@
 
 Requires: pip install cairosvg
 Usage:    python generate-icons.py
+
+Icons newer than this script are left alone, so reruns only rasterize
+after the SVG below changes.
 """
-import cairosvg
+import os
+
+from cairosvg.parser import Tree
+from cairosvg.surface import PNGSurface
 
 SVG = """\
 <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24"
@@ -22,13 +28,22 @@ sizes = [
     (128, "icon-128.png"),
 ]
 
+source_mtime = os.path.getmtime(__file__)
+
+# parsed once; every size is drawn from the same tree
+tree = Tree(bytestring=SVG.encode())
+
 for size, filename in sizes:
-    cairosvg.svg2png(
-        bytestring=SVG.encode(),
-        write_to=filename,
+    if os.path.exists(filename) and os.path.getmtime(filename) >= source_mtime:
+        print(f"Skipped {filename} (up to date)")
+        continue
+    PNGSurface(
+        tree,
+        filename,
+        dpi=96,
         output_width=size,
         output_height=size,
-    )
+    ).finish()
     print(f"Generated {filename} ({size}x{size})")
 
 print("All icons generated successfully!")